@@ -1,4 +1,4 @@
-use futures::{future, stream::SplitSink};
+use futures::{future, stream::SplitSink, FutureExt};
 use futures_util::sink::SinkExt;
 use std::sync::Arc;
 use tokio::{
@@ -8,6 +8,7 @@ use tokio::{
         mpsc::{self, UnboundedReceiver, UnboundedSender},
         Mutex,
     },
+    task::unconstrained,
 };
 use tokio_util::codec::Framed;
 
@@ -67,9 +68,19 @@ impl DataSender {
         loop {
             match self.rx.recv().await {
                 Some(msg) => {
-                    if let Err(e) = self.sink.send(msg).await.map_err(CommunicationError::from) {
-                        return Err(e);
+                    self.sink
+                        .feed(msg)
+                        .await
+                        .map_err(CommunicationError::from)?;
+                    // Buffer the messages that are already queued, and write them to the
+                    // TCP stream with a single flush instead of one flush per message.
+                    while let Some(Some(msg)) = unconstrained(self.rx.recv()).now_or_never() {
+                        self.sink
+                            .feed(msg)
+                            .await
+                            .map_err(CommunicationError::from)?;
                     }
+                    self.sink.flush().await.map_err(CommunicationError::from)?;
                 }
                 None => return Err(CommunicationError::Disconnected),
             }
@@ -1,6 +1,6 @@
 use std::{
     borrow::BorrowMut,
-    sync::{Arc, Mutex},
+    sync::{Arc, Condvar, Mutex},
     thread,
     time::Duration,
 };
@@ -75,8 +75,9 @@ where
     id: StreamId,
     /// The ReadStream associated with the ExtractStream.
     read_stream_option: Option<ReadStream<D>>,
-    // Used to circumvent requiring Send to transfer ReadStream across threads
-    channel_manager_option: Arc<Mutex<Option<Arc<Mutex<ChannelManager>>>>>,
+    // Used to circumvent requiring Send to transfer ReadStream across threads. The condition
+    // variable is notified once the setup hook provides the channel manager.
+    channel_manager_option: Arc<(Mutex<Option<Arc<Mutex<ChannelManager>>>>, Condvar)>,
 }
 
 impl<D> ExtractStream<D>
@@ -101,7 +102,7 @@ where
         let extract_stream = Self {
             id,
             read_stream_option: None,
-            channel_manager_option: Arc::new(Mutex::new(None)),
+            channel_manager_option: Arc::new((Mutex::new(None), Condvar::new())),
         };
 
         default_graph::add_extract_stream(&extract_stream);
@@ -126,7 +127,7 @@ where
             read_stream.try_read()
         } else {
             // Try to setup read stream
-            if let Some(channel_manager) = &*self.channel_manager_option.lock().unwrap() {
+            if let Some(channel_manager) = &*self.channel_manager_option.0.lock().unwrap() {
                 match channel_manager.lock().unwrap().take_recv_endpoint(self.id) {
                     Ok(recv_endpoint) => {
                         let mut read_stream = ReadStream::new(
@@ -157,6 +158,18 @@ where
     /// Returns the Message available on the [`ReadStream`].
     pub fn read(&mut self) -> Result<Message<D>, ReadError> {
         loop {
+            if let Some(read_stream) = self.read_stream_option.as_mut() {
+                return read_stream.read();
+            }
+            {
+                // Block until the setup hook provides the channel manager.
+                let (lock, cvar) = &*self.channel_manager_option;
+                let _channel_manager = cvar
+                    .wait_while(lock.lock().unwrap(), |channel_manager| {
+                        channel_manager.is_none()
+                    })
+                    .unwrap();
+            }
             let result = self.try_read();
             if self.read_stream_option.is_some() {
                 match result {
@@ -169,6 +182,7 @@ where
                     Err(TryReadError::Closed) => return Err(ReadError::Closed),
                 };
             } else {
+                // Setting up the read stream failed, retry later.
                 thread::sleep(Duration::from_millis(100));
             }
         }
@@ -187,13 +201,59 @@ where
         let channel_manager_option_copy = Arc::clone(&self.channel_manager_option);
 
         move |channel_manager: Arc<Mutex<ChannelManager>>| {
-            channel_manager_option_copy
-                .lock()
-                .unwrap()
-                .replace(channel_manager);
+            let (lock, cvar) = &*channel_manager_option_copy;
+            lock.lock().unwrap().replace(channel_manager);
+            cvar.notify_all();
         }
     }
 }
 
 // Needed to avoid deadlock in Python
 unsafe impl<D> Send for ExtractStream<D> where for<'a> D: Data + Deserialize<'a> {}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use crate::dataflow::{
+        stream::{IngestStream, WriteStreamT},
+        Timestamp,
+    };
+
+    /// Test that a read started before the setup hook runs is woken up by the hook, and returns
+    /// the message sent on the stream afterwards.
+    #[test]
+    fn test_read_wakes_up_on_setup() {
+        // Use an IngestStream to register a stream with a name in the default graph.
+        let ingest_stream: IngestStream<usize> = IngestStream::new();
+        let id = ingest_stream.id();
+        let mut extract_stream: ExtractStream<usize> = ExtractStream {
+            id,
+            read_stream_option: None,
+            channel_manager_option: Arc::new((Mutex::new(None), Condvar::new())),
+        };
+        let setup_hook = extract_stream.get_setup_hook();
+
+        let reader = thread::spawn(move || extract_stream.read());
+
+        // Give the reader a chance to block before setting up the stream. The test does not rely
+        // on this ordering for correctness.
+        thread::sleep(Duration::from_millis(20));
+        let channel_manager = Arc::new(Mutex::new(
+            ChannelManager::new_with_inter_thread_channels::<usize>(0, &[id]),
+        ));
+        let mut write_stream = channel_manager
+            .lock()
+            .unwrap()
+            .write_stream::<usize>(id)
+            .unwrap();
+        setup_hook(channel_manager);
+        write_stream
+            .send(Message::new_message(Timestamp::Time(vec![1]), 1))
+            .unwrap();
+
+        assert_eq!(
+            reader.join().unwrap(),
+            Ok(Message::new_message(Timestamp::Time(vec![1]), 1))
+        );
+    }
+}
@@ -100,25 +100,19 @@ impl<D: Data> ReadStream<D> {
         if self.is_closed {
             return Err(ReadError::Closed);
         }
-        // Poll for the next message
-        // TODO: call async_read and use some kind of runtime.
-        let result = self
-            .recv_endpoint
-            .as_mut()
-            .map_or(Err(ReadError::Disconnected), |rx| loop {
-                match rx.try_read() {
-                    Ok(msg) => {
-                        break Ok(Message::clone(&msg));
-                    }
-                    Err(TryRecvError::Empty) => (),
-                    Err(TryRecvError::Disconnected) => {
-                        break Err(ReadError::Disconnected);
-                    }
-                    Err(TryRecvError::BincodeError(_)) => {
-                        break Err(ReadError::SerializationError);
-                    }
-                }
-            });
+        // Return an available message without blocking, and otherwise park the thread until the
+        // next message arrives instead of spinning on the endpoint.
+        let result =
+            self.recv_endpoint
+                .as_mut()
+                .map_or(Err(ReadError::Disconnected), |rx| match rx.try_read() {
+                    Ok(msg) => Ok(Message::clone(&msg)),
+                    Err(TryRecvError::Empty) => futures::executor::block_on(rx.read())
+                        .map(|msg| Message::clone(&msg))
+                        .map_err(|_| ReadError::Disconnected),
+                    Err(TryRecvError::Disconnected) => Err(ReadError::Disconnected),
+                    Err(TryRecvError::BincodeError(_)) => Err(ReadError::SerializationError),
+                });
 
         if result
             .as_ref()
@@ -161,3 +155,72 @@ impl<D: Data> ReadStream<D> {
 
 unsafe impl<T: Data> Send for ReadStream<T> {}
 unsafe impl<T: Data> Sync for ReadStream<T> {}
+
+#[cfg(test)]
+mod test {
+    use std::{thread, time::Duration};
+
+    use tokio::sync::mpsc;
+
+    use super::*;
+    use crate::dataflow::Timestamp;
+
+    /// Returns a [`ReadStream`] connected to the returned inter-thread channel sender.
+    fn new_read_stream() -> (
+        mpsc::UnboundedSender<Arc<Message<usize>>>,
+        ReadStream<usize>,
+    ) {
+        let (tx, rx) = mpsc::unbounded_channel();
+        let read_stream = ReadStream::new(
+            StreamId::new_deterministic(),
+            "test_read_stream",
+            Some(RecvEndpoint::InterThread(rx)),
+        );
+        (tx, read_stream)
+    }
+
+    /// Test that a blocking read returns a message that is sent after the read started.
+    #[test]
+    fn test_read_waits_for_message() {
+        let (tx, mut read_stream) = new_read_stream();
+        let sender = thread::spawn(move || {
+            thread::sleep(Duration::from_millis(50));
+            tx.send(Arc::new(Message::new_message(Timestamp::Time(vec![1]), 1)))
+                .unwrap();
+            tx
+        });
+        assert_eq!(
+            read_stream.read(),
+            Ok(Message::new_message(Timestamp::Time(vec![1]), 1))
+        );
+        assert!(!read_stream.is_closed());
+        sender.join().unwrap();
+    }
+
+    /// Test that a blocking read returns an error when the sender is dropped.
+    #[test]
+    fn test_read_disconnected() {
+        let (tx, mut read_stream) = new_read_stream();
+        let sender = thread::spawn(move || {
+            thread::sleep(Duration::from_millis(50));
+            drop(tx);
+        });
+        assert_eq!(read_stream.read(), Err(ReadError::Disconnected));
+        sender.join().unwrap();
+    }
+
+    /// Test that the stream is closed after reading a top watermark.
+    #[test]
+    fn test_read_top_watermark_closes_stream() {
+        let (tx, mut read_stream) = new_read_stream();
+        tx.send(Arc::new(Message::new_watermark(Timestamp::Top)))
+            .unwrap();
+        assert_eq!(
+            read_stream.read(),
+            Ok(Message::new_watermark(Timestamp::Top))
+        );
+        assert!(read_stream.is_closed());
+        assert_eq!(read_stream.read(), Err(ReadError::Closed));
+        assert_eq!(read_stream.try_read(), Err(TryReadError::Closed));
+    }
+}
@@ -116,11 +116,15 @@ impl<D: Data> WriteStream<D> {
     /// Updates the last watermark received on the stream.
     ///
     /// # Arguments
+    /// * `stats` - The locked statistics of the stream.
     /// * `msg` - The message to be sent on the stream.
-    fn update_statistics(&mut self, msg: &Message<D>) -> Result<(), SendError> {
+    fn update_statistics(
+        &self,
+        stats: &mut WriteStreamStatistics,
+        msg: &Message<D>,
+    ) -> Result<(), SendError> {
         match msg {
             Message::TimestampedData(td) => {
-                let mut stats = self.stats.lock().unwrap();
                 if td.timestamp < *stats.low_watermark() {
                     return Err(SendError::TimestampError);
                 }
@@ -130,7 +134,6 @@ impl<D: Data> WriteStream<D> {
                     .increment_msg_count(self.id(), td.timestamp.clone())
             }
             Message::Watermark(msg_watermark) => {
-                let mut stats = self.stats.lock().unwrap();
                 if msg_watermark < stats.low_watermark() {
                     return Err(SendError::TimestampError);
                 }
@@ -185,14 +188,20 @@ impl<D: Data> fmt::Debug for WriteStream<D> {
 
 impl<'a, D: Data + Deserialize<'a>> WriteStreamT<D> for WriteStream<D> {
     fn send(&mut self, msg: Message<D>) -> Result<(), SendError> {
-        // Check if the stream was closed before, and return an error.
-        if self.is_closed() {
-            tracing::warn!(
-                "Trying to send messages on a closed WriteStream {} (ID: {})",
-                self.name(),
-                self.id(),
-            );
-            return Err(SendError::Closed);
+        // Check if the stream was closed and update the watermark while holding the statistics
+        // lock once, instead of acquiring it separately for each step.
+        {
+            let mut stats = self.stats.lock().unwrap();
+            // Check if the stream was closed before, and return an error.
+            if stats.is_stream_closed() {
+                tracing::warn!(
+                    "Trying to send messages on a closed WriteStream {} (ID: {})",
+                    self.name(),
+                    self.id(),
+                );
+                return Err(SendError::Closed);
+            }
+            self.update_statistics(&mut stats, &msg)?;
         }
 
         // Close the stream later if the message being sent represents the top watermark.
@@ -206,8 +215,7 @@ impl<'a, D: Data + Deserialize<'a>> WriteStreamT<D> for WriteStream<D> {
             close_stream = true;
         }
 
-        // Update the watermark and send the message forward.
-        self.update_statistics(&msg)?;
+        // Send the message forward.
         let msg_arc = Arc::new(msg);
 
         match self.pusher.as_mut() {
@@ -327,3 +327,27 @@ impl ChannelManager {
             .map(|endpoints| WriteStream::from_endpoints(endpoints, stream_id))
     }
 }
+
+#[cfg(test)]
+impl ChannelManager {
+    /// Creates a [`ChannelManager`] that connects each of the given streams to a single receiver
+    /// on the same node.
+    pub(crate) fn new_with_inter_thread_channels<D>(
+        node_id: NodeId,
+        stream_ids: &[StreamId],
+    ) -> Self
+    where
+        for<'a> D: Data + Deserialize<'a>,
+    {
+        let mut stream_entries: HashMap<StreamId, Box<dyn StreamEndpointsT>> = HashMap::new();
+        for stream_id in stream_ids {
+            let mut stream_endpoints = StreamEndpoints::<D>::new(*stream_id);
+            stream_endpoints.add_inter_thread_channel();
+            stream_entries.insert(*stream_id, Box::new(stream_endpoints));
+        }
+        Self {
+            node_id,
+            stream_entries,
+        }
+    }
+}
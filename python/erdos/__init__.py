@@ -473,19 +473,22 @@ def profile(event_name, operator, event_data=None):
 
 
 def profile_method(**decorator_kwargs):
+    # Resolved once per decorated method rather than on every invocation.
+    user_event_name = decorator_kwargs.get("event_name")
+
     def decorator(func):
+        cb_name = func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if isinstance(args[0], erdos.operator.BaseOperator):
                 # The func is an operator method.
-                op_name = args[0].config.name
-                cb_name = func.__name__
-                if "event_name" in decorator_kwargs:
-                    event_name = decorator_kwargs["event_name"]
+                if user_event_name is not None:
+                    event_name = user_event_name
                 else:
                     # Set the event name to the operator name and the callback
                     # name if it's not passed by the user.
-                    event_name = op_name + "." + cb_name
+                    event_name = args[0].config.name + "." + cb_name
                 timestamp = None
                 if len(args) > 1:
                     if isinstance(args[1], Timestamp):
@@ -497,9 +500,9 @@ def profile_method(**decorator_kwargs):
             else:
                 raise TypeError("@erdos.profile can only be used on operator methods")
 
-            with erdos.profile(
-                event_name, args[0], event_data={"timestamp": str(timestamp)}
-            ):
+            # The event data always maps strings to strings, so it is not
+            # validated on every invocation.
+            with Profile._unchecked(event_name, args[0], {"timestamp": str(timestamp)}):
                 return func(*args, **kwargs)
 
         return wrapper
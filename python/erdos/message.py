@@ -13,8 +13,14 @@ class Message:
     Attributes:
         timestamp: The timestamp of the message.
         data: The data of the message.
+
+    Messages define `__slots__`, so no other attributes can be assigned to a
+    :py:class:`Message` or a :py:class:`WatermarkMessage`. Subclasses that do
+    not define `__slots__` may set additional attributes.
     """
 
+    __slots__ = ("timestamp", "data", "_serialized_data", "__weakref__")
+
     def __init__(self, timestamp: Timestamp, data: Any):
         """Constructs a :py:class:`Message` with the given `data` and
         `timestamp`.
@@ -66,6 +72,8 @@ class WatermarkMessage(Message):
         timestamp: The timestamp for which this is a watermark.
     """
 
+    __slots__ = ()
+
     def __init__(self, timestamp: Timestamp):
         super(WatermarkMessage, self).__init__(timestamp, None)
 
@@ -1,5 +1,7 @@
 import json
+import logging
 from collections import defaultdict, deque
+from functools import partial
 from typing import Any
 
 import numpy as np
@@ -33,11 +35,13 @@ class BaseOperator:
     def add_trace_event(self, event):
         """Records a profile trace event."""
         self._trace_events.append(event)
-        self._trace_event_logger.info(json.dumps(event))
+        # Avoid serializing the event when the trace logger discards it.
+        if self._trace_event_logger.isEnabledFor(logging.INFO):
+            self._trace_event_logger.info(json.dumps(event))
         event_name = event["name"]
+        # The deque discards the oldest sample once it holds
+        # MAX_NUM_RUNTIME_SAMPLES entries.
         self._runtime_stats[event_name].append(event["dur"])
-        if len(self._runtime_stats[event_name]) > MAX_NUM_RUNTIME_SAMPLES:
-            self._runtime_stats[event_name].popleft()
 
     def get_runtime(self, event_name, percentile):
         """Gets the runtime percentile for a given type of event.
@@ -80,7 +84,9 @@ class Source(BaseOperator):
         """
         instance = super(Source, cls).__new__(cls, *args, **kwargs)
         instance._trace_events = []
-        instance._runtime_stats = defaultdict(deque)
+        instance._runtime_stats = defaultdict(
+            partial(deque, maxlen=MAX_NUM_RUNTIME_SAMPLES)
+        )
         return instance
 
     def run(self, write_stream: WriteStream):
@@ -120,7 +126,9 @@ class Sink(BaseOperator):
         """
         instance = super(Sink, cls).__new__(cls, *args, **kwargs)
         instance._trace_events = []
-        instance._runtime_stats = defaultdict(deque)
+        instance._runtime_stats = defaultdict(
+            partial(deque, maxlen=MAX_NUM_RUNTIME_SAMPLES)
+        )
         return instance
 
     def run(self, read_stream: ReadStream):
@@ -183,7 +191,9 @@ class OneInOneOut(BaseOperator):
         """
         instance = super(OneInOneOut, cls).__new__(cls, *args, **kwargs)
         instance._trace_events = []
-        instance._runtime_stats = defaultdict(deque)
+        instance._runtime_stats = defaultdict(
+            partial(deque, maxlen=MAX_NUM_RUNTIME_SAMPLES)
+        )
         return instance
 
     def run(self, read_stream: ReadStream, write_stream: WriteStream):
@@ -248,7 +258,9 @@ class TwoInOneOut(BaseOperator):
         """
         instance = super(TwoInOneOut, cls).__new__(cls, *args, **kwargs)
         instance._trace_events = []
-        instance._runtime_stats = defaultdict(deque)
+        instance._runtime_stats = defaultdict(
+            partial(deque, maxlen=MAX_NUM_RUNTIME_SAMPLES)
+        )
         return instance
 
     def run(
@@ -332,7 +344,9 @@ class OneInTwoOut(BaseOperator):
         """
         instance = super(OneInTwoOut, cls).__new__(cls, *args, **kwargs)
         instance._trace_events = []
-        instance._runtime_stats = defaultdict(deque)
+        instance._runtime_stats = defaultdict(
+            partial(deque, maxlen=MAX_NUM_RUNTIME_SAMPLES)
+        )
         return instance
 
     def run(
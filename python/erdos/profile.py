@@ -2,7 +2,12 @@ import time
 
 
 class Profile:
-    """Used to log the duration of a snippet of code using a with statement."""
+    """Used to log the duration of a snippet of code using a with statement.
+
+    The `event_data` must be a dict mapping strings to strings. It is
+    validated when the :py:class:`Profile` is constructed, so invalid data
+    raises a `ValueError` before the profiled code runs.
+    """
 
     def __init__(self, event_name, operator, event_data=None):
         self.event_name = event_name
@@ -10,23 +15,39 @@ class Profile:
         if event_data is None:
             self.event_data = {}
         else:
+            for key, value in event_data.items():
+                if not isinstance(key, str) or not isinstance(value, str):
+                    raise ValueError(
+                        "The event_data must be a dict mapping strings to strings"
+                    )
             self.event_data = event_data
 
+    @classmethod
+    def _unchecked(cls, event_name, operator, event_data):
+        """Constructs a :py:class:`Profile` without validating `event_data`.
+
+        Used internally for event data that is known to map strings to
+        strings (e.g., in :py:func:`erdos.profile_method`).
+        """
+        profile = cls.__new__(cls)
+        profile.event_name = event_name
+        profile.operator = operator
+        profile.event_data = event_data
+        return profile
+
     def __enter__(self):
         """Log the start time of a profile event."""
         self.start_time = time.time()
+        # The duration is measured with a monotonic clock, which is unaffected
+        # by adjustments to the system time.
+        self._start_counter = time.perf_counter()
         return self
 
     def __exit__(self, type, value, traceback):
-        for key, value in self.event_data.items():
-            if not isinstance(key, str) or not isinstance(value, str):
-                raise ValueError(
-                    "The event_data must be a dict mapping strings to strings"
-                )
         # Start time in us.
         ts = int(self.start_time * 1000 * 1000)
         # Duration in us.
-        dur = int((time.time() - self.start_time) * 1000 * 1000)
+        dur = int((time.perf_counter() - self._start_counter) * 1000 * 1000)
         # Log the event in the Google Chrome trace event format.
         event = {
             "name": self.event_name,
@@ -157,7 +157,10 @@ class WriteStream:
             raise TypeError("msg must inherent from erdos.Message!")
 
         internal_msg = msg._to_py_message()
-        logger.debug("Sending message {} on the stream {}".format(msg, self.name))
+        # Formatting the message stringifies its data, so only do it if the
+        # record will actually be emitted.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending message {} on the stream {}".format(msg, self.name))
 
         # Raise exception with the name.
         try:
@@ -229,9 +232,10 @@ class IngestStream(Stream):
         if not isinstance(msg, Message):
             raise TypeError("msg must inherent from erdos.Message!")
 
-        logger.debug(
-            "Sending message {} on the Ingest stream {}".format(msg, self.name)
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sending message {} on the Ingest stream {}".format(msg, self.name)
+            )
 
         internal_msg = msg._to_py_message()
         self._internal_stream.send(internal_msg)
@@ -6,8 +6,14 @@ from erdos.internal import PyTimestamp
 class Timestamp:
     """An ERDOS timestamp representing the time for which a
     :py:class:`Message` or :py:class:`WatermarkMessage` is sent.
+
+    Timestamps define `__slots__`, so no other attributes can be assigned to a
+    :py:class:`Timestamp`. Subclasses that do not define `__slots__` may set
+    additional attributes.
     """
 
+    __slots__ = ("_py_timestamp", "__weakref__")
+
     def __init__(
         self,
         timestamp=None,
@@ -78,10 +84,7 @@ class Timestamp:
         return self._py_timestamp >= timestamp._py_timestamp
 
     def __hash__(self):
-        coordinates = self._py_timestamp.coordinates()
-        if coordinates is not None:
-            coordinates = tuple(coordinates)
-        return hash((coordinates, self.is_top, self.is_bottom))
+        return hash(self._py_timestamp)
 
     @property
     def coordinates(self) -> List[int]:
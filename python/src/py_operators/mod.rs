@@ -17,6 +17,24 @@ pub(crate) use py_sink::*;
 pub(crate) use py_source::*;
 pub(crate) use py_two_in_one_out::*;
 
+/// Looks up the context type `erdos.context.<context_type>` and `pickle.loads`, which are invoked
+/// by the message and watermark callbacks of a Python operator.
+fn lookup_callback_objects(context_type: &str) -> (PyObject, PyObject) {
+    Python::with_gil(|py| {
+        let py_context_type = PyModule::import(py, "erdos.context")
+            .unwrap()
+            .getattr(context_type)
+            .unwrap()
+            .to_object(py);
+        let py_pickle_loads = PyModule::import(py, "pickle")
+            .unwrap()
+            .getattr("loads")
+            .unwrap()
+            .to_object(py);
+        (py_context_type, py_pickle_loads)
+    })
+}
+
 fn construct_operator(
     py_operator_type: Arc<PyObject>,
     py_operator_args: Arc<PyObject>,
@@ -13,6 +13,9 @@ use crate::{PyReadStream, PyTimestamp, PyWriteStream};
 pub(crate) struct PyOneInOneOut {
     py_operator_config: Arc<PyObject>,
     py_operator: Arc<PyObject>,
+    // Python objects invoked on every callback, which are looked up once upon construction.
+    py_context_type: PyObject,
+    py_pickle_loads: PyObject,
     // The py_write_stream is set to Option, since the constructor does not receive a WriteStream,
     // but we expect this to be populated once the executor calls the `run` method of the operator.
     py_write_stream: Option<Arc<PyObject>>,
@@ -37,9 +40,13 @@ impl PyOneInOneOut {
             py_operator_config,
             config,
         );
+        let (py_context_type, py_pickle_loads) =
+            super::lookup_callback_objects("OneInOneOutContext");
         Self {
             py_operator_config: py_operator_config_clone,
             py_operator,
+            py_context_type,
+            py_pickle_loads,
             py_write_stream: None,
         }
     }
@@ -184,30 +191,19 @@ write_stream = erdos.WriteStream(_py_write_stream=py_write_stream)
             None => unreachable!(),
         };
         Python::with_gil(|py| {
-            let erdos = PyModule::import(py, "erdos").unwrap();
-            let pickle = PyModule::import(py, "pickle").unwrap();
-
-            let context: PyObject = erdos
-                .getattr("context")
-                .unwrap()
-                .getattr("OneInOneOutContext")
-                .unwrap()
-                .call1((
-                    py_time,
-                    py_operator_config.clone_ref(py),
-                    py_write_stream.clone_ref(py),
-                ))
-                .unwrap()
-                .extract()
+            let context = self
+                .py_context_type
+                .call1(
+                    py,
+                    (
+                        py_time,
+                        py_operator_config.clone_ref(py),
+                        py_write_stream.clone_ref(py),
+                    ),
+                )
                 .unwrap();
             let serialized_data = PyBytes::new(py, &data[..]);
-            let py_data: PyObject = pickle
-                .getattr("loads")
-                .unwrap()
-                .call1((serialized_data,))
-                .unwrap()
-                .extract()
-                .unwrap();
+            let py_data = self.py_pickle_loads.call1(py, (serialized_data,)).unwrap();
             if let Err(e) = self
                 .py_operator
                 .call_method1(py, "on_data", (context, py_data))
@@ -226,19 +222,16 @@ write_stream = erdos.WriteStream(_py_write_stream=py_write_stream)
         };
 
         Python::with_gil(|py| {
-            let erdos = PyModule::import(py, "erdos").unwrap();
-            let context: PyObject = erdos
-                .getattr("context")
-                .unwrap()
-                .getattr("OneInOneOutContext")
-                .unwrap()
-                .call1((
-                    py_time,
-                    py_operator_config.clone_ref(py),
-                    py_write_stream.clone_ref(py),
-                ))
-                .unwrap()
-                .extract()
+            let context = self
+                .py_context_type
+                .call1(
+                    py,
+                    (
+                        py_time,
+                        py_operator_config.clone_ref(py),
+                        py_write_stream.clone_ref(py),
+                    ),
+                )
                 .unwrap();
             if let Err(e) = self
                 .py_operator
@@ -12,6 +12,9 @@ use crate::{PyReadStream, PyTimestamp};
 pub(crate) struct PySink {
     py_operator_config: Arc<PyObject>,
     py_operator: Arc<PyObject>,
+    // Python objects invoked on every callback, which are looked up once upon construction.
+    py_context_type: PyObject,
+    py_pickle_loads: PyObject,
 }
 
 impl PySink {
@@ -33,10 +36,13 @@ impl PySink {
             py_operator_config,
             config,
         );
+        let (py_context_type, py_pickle_loads) = super::lookup_callback_objects("SinkContext");
 
         Self {
             py_operator_config: py_operator_config_clone,
             py_operator,
+            py_context_type,
+            py_pickle_loads,
         }
     }
 }
@@ -127,25 +133,12 @@ read_stream = erdos.ReadStream(_py_read_stream=py_read_stream)
         let py_time = PyTimestamp::from(ctx.timestamp().clone());
         let py_operator_config = Arc::clone(&self.py_operator_config);
         Python::with_gil(|py| {
-            let erdos = PyModule::import(py, "erdos").unwrap();
-            let pickle = PyModule::import(py, "pickle").unwrap();
-            let context: PyObject = erdos
-                .getattr("context")
-                .unwrap()
-                .getattr("SinkContext")
-                .unwrap()
-                .call1((py_time, py_operator_config.clone_ref(py)))
-                .unwrap()
-                .extract()
+            let context = self
+                .py_context_type
+                .call1(py, (py_time, py_operator_config.clone_ref(py)))
                 .unwrap();
             let serialized_data = PyBytes::new(py, &data[..]);
-            let py_data: PyObject = pickle
-                .getattr("loads")
-                .unwrap()
-                .call1((serialized_data,))
-                .unwrap()
-                .extract()
-                .unwrap();
+            let py_data = self.py_pickle_loads.call1(py, (serialized_data,)).unwrap();
             if let Err(e) = self
                 .py_operator
                 .call_method1(py, "on_data", (context, py_data))
@@ -159,15 +152,9 @@ read_stream = erdos.ReadStream(_py_read_stream=py_read_stream)
         let py_time = PyTimestamp::from(ctx.timestamp().clone());
         let py_operator_config = Arc::clone(&self.py_operator_config);
         Python::with_gil(|py| {
-            let erdos = PyModule::import(py, "erdos").unwrap();
-            let context: PyObject = erdos
-                .getattr("context")
-                .unwrap()
-                .getattr("SinkContext")
-                .unwrap()
-                .call1((py_time, py_operator_config.clone_ref(py)))
-                .unwrap()
-                .extract()
+            let context = self
+                .py_context_type
+                .call1(py, (py_time, py_operator_config.clone_ref(py)))
                 .unwrap();
             if let Err(e) = self
                 .py_operator
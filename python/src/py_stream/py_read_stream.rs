@@ -36,14 +36,15 @@ impl PyReadStream {
     }
 
     /// Returns (timestamp, data)
-    fn read(&mut self) -> PyResult<PyMessage> {
+    fn read(&mut self, py: Python) -> PyResult<PyMessage> {
         // NOTE: Since the executor of a Python's `run` method holds a reference to the same Arc
         // that backs a PyReadStream (in order to drop after its execution), we need to do a
         // `get_mut_unchecked` instead of a `get_mut` to bypass the reference counting checks, and
         // retrieve the underlying ReadStream.
         unsafe {
             let read_stream = Arc::get_mut_unchecked(&mut self.read_stream);
-            match read_stream.read() {
+            // Release the GIL while blocked waiting for the next message.
+            match py.allow_threads(|| read_stream.read()) {
                 Ok(msg) => Ok(PyMessage::from(msg)),
                 Err(e) => {
                     let error_str = format!(
@@ -1,3 +1,8 @@
+use std::{
+    collections::hash_map::DefaultHasher,
+    hash::{Hash, Hasher},
+};
+
 use erdos::dataflow::Timestamp;
 use pyo3::{basic::CompareOp, exceptions, prelude::*};
 
@@ -58,6 +63,12 @@ impl PyTimestamp {
         self.__str__()
     }
 
+    fn __hash__(&self) -> isize {
+        let mut hasher = DefaultHasher::new();
+        self.timestamp.hash(&mut hasher);
+        hasher.finish() as isize
+    }
+
     fn __richcmp__(&self, other: PyTimestamp, op: CompareOp) -> PyResult<bool> {
         match op {
             CompareOp::Lt => Ok(self.timestamp < other.timestamp),